@@ -2,46 +2,44 @@
 from __future__ import annotations
 
 import logging
-import time
 
 import voluptuous as vol
 
-from homeassistant.components.climate import PLATFORM_SCHEMA, ClimateEntity
+from homeassistant.components.climate import (
+    PLATFORM_SCHEMA,
+    ClimateEntity,
+    ClimateEntityFeature,
+)
 from homeassistant.components.climate.const import (
-    HVAC_MODE_OFF,
-    HVAC_MODE_AUTO,
-    HVAC_MODE_HEAT,
-    HVAC_MODE_COOL,
-    HVAC_MODE_DRY,
-    HVAC_MODE_FAN_ONLY,
     FAN_AUTO,
     FAN_LOW,
     FAN_MEDIUM,
     FAN_HIGH,
-    SUPPORT_FAN_MODE,
-    SUPPORT_TARGET_TEMPERATURE,
+    HVACMode,
 )
 from homeassistant.components.modbus import get_hub
 from homeassistant.components.modbus.const import (
-    CALL_TYPE_REGISTER_HOLDING,
-    CALL_TYPE_REGISTER_INPUT,
     CALL_TYPE_WRITE_REGISTER,
+    CALL_TYPE_WRITE_REGISTERS,
     ATTR_HUB,
     DEFAULT_HUB,
 )
-from homeassistant.components.modbus.modbus import ModbusHub
 from homeassistant.const import (
     ATTR_TEMPERATURE,
     CONF_NAME,
     CONF_SLAVE,
     DEVICE_DEFAULT_NAME,
-    TEMP_CELSIUS,
-    PRECISION_WHOLE
+    PRECISION_WHOLE,
+    UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import IntesisCoordinator
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -53,14 +51,19 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 
 _LOGGER = logging.getLogger(__name__)
 
-SUPPORT_FLAGS = SUPPORT_TARGET_TEMPERATURE | SUPPORT_FAN_MODE
+SUPPORT_FLAGS = (
+    ClimateEntityFeature.TARGET_TEMPERATURE
+    | ClimateEntityFeature.FAN_MODE
+    | ClimateEntityFeature.TURN_ON
+    | ClimateEntityFeature.TURN_OFF
+)
 
 HVAC_MODES_MAP = [
-    HVAC_MODE_AUTO,
-    HVAC_MODE_HEAT,
-    HVAC_MODE_DRY,
-    HVAC_MODE_FAN_ONLY,
-    HVAC_MODE_COOL
+    HVACMode.AUTO,
+    HVACMode.HEAT,
+    HVACMode.DRY,
+    HVACMode.FAN_ONLY,
+    HVACMode.COOL
 ]
 
 FAN_MODES_MAP = [
@@ -71,6 +74,12 @@ FAN_MODES_MAP = [
     'super_high'
 ]
 
+# hvac mode indexed by register 1 + 1, with index 0 for when the unit is off
+_HVAC_OR_OFF = (HVACMode.OFF,) + tuple(HVAC_MODES_MAP)
+
+HVAC_MODES_INDEX = {mode: i for i, mode in enumerate(HVAC_MODES_MAP)}
+FAN_MODES_INDEX = {mode: i for i, mode in enumerate(FAN_MODES_MAP)}
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -81,115 +90,138 @@ async def async_setup_platform(
     """Set up the Intesis Modbus RTU Platform."""
     modbus_slave = config.get(CONF_SLAVE)
     name = config.get(CONF_NAME)
-    hub = get_hub(hass, config[ATTR_HUB])
-    async_add_entities([IntesisModbusRTU(hub, modbus_slave, name)], True)
+    hub_name = config[ATTR_HUB]
+
+    coordinators = hass.data.setdefault(DOMAIN, {})
+    coordinator = coordinators.get(hub_name)
+    if coordinator is None:
+        coordinator = IntesisCoordinator(hass, get_hub(hass, hub_name), hub_name)
+        coordinators[hub_name] = coordinator
+
+    async_add_entities([IntesisModbusRTU(coordinator, modbus_slave, name)])
 
 
-class IntesisModbusRTU(ClimateEntity):
+class IntesisModbusRTU(CoordinatorEntity[IntesisCoordinator], ClimateEntity):
     """Representation of an Intesis AC unit."""
 
     _attr_min_temp = 17
     _attr_max_temp = 30
-    _attr_precision = 1.0
-    _attr_target_temperature_step = 1.0
+    _attr_precision = PRECISION_WHOLE
+    _attr_target_temperature_step = PRECISION_WHOLE
+    _attr_supported_features = SUPPORT_FLAGS
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_hvac_modes = [
+        HVACMode.OFF,
+        HVACMode.HEAT,
+        HVACMode.COOL,
+        HVACMode.DRY,
+        HVACMode.FAN_ONLY,
+    ]
+    _attr_fan_modes = [FAN_LOW, FAN_MEDIUM, FAN_HIGH]
+    _attr_hvac_mode = None
+    _attr_fan_mode = None
 
     def __init__(
-        self, hub: ModbusHub, modbus_slave: int | None, name: str | None
+        self,
+        coordinator: IntesisCoordinator,
+        modbus_slave: int | None,
+        name: str | None,
     ) -> None:
         """Initialize the unit."""
-        self._hub = hub
-        self._name = name
+        super().__init__(coordinator)
+        self._hub = coordinator.hub
+        self._attr_name = name
         self._slave = modbus_slave
-        self._target_temperature = None
-        self._current_temperature = None
-        self._current_fan_mode = None
-        self._fan_modes = [FAN_LOW, FAN_MEDIUM, FAN_HIGH]
-        self._current_hvac_mode = None
-        self._hvac_modes = [
-            HVAC_MODE_OFF, 
-            HVAC_MODE_HEAT, 
-            HVAC_MODE_COOL, 
-            HVAC_MODE_DRY, 
-            HVAC_MODE_FAN_ONLY
-            ]
+        self._written_state = None
+        self._unknown_mode = None
+        self._unknown_fan_mode = None
+        self._cancel_refresh = None
         _LOGGER.debug("Initialised Intesis AC unit")    
 
     @property
-    def supported_features(self):
-        """Return the list of supported features."""
-        return SUPPORT_FLAGS
+    def available(self) -> bool:
+        """Return if the unit responded to the last poll."""
+        return (
+            super().available
+            and self.coordinator.data is not None
+            and self._slave in self.coordinator.data
+        )
 
-    async def async_update(self):
+    async def async_added_to_hass(self) -> None:
+        """Register the unit with the hub's coordinator and read its state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_slave(self._slave))
+        self._update_from_coordinator()
+        await self.coordinator.async_request_refresh()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending refresh."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_refresh is not None:
+            self._cancel_refresh()
+            self._cancel_refresh = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self._async_write_state_if_changed()
+
+    def _update_from_coordinator(self):
         """Update unit attributes."""
+        if not self.available:
+            return
+
         _LOGGER.debug("Updating state")
-        result = await self._hub.async_pb_call(
-            self._slave, 0, 24, CALL_TYPE_REGISTER_HOLDING
-        )
-        _LOGGER.debug(result.registers)
+        state = self.coordinator.data[self._slave]
+        _LOGGER.debug("State: %s", state)
 
-        state = result.registers
+        mode_idx = 0 if state.power == 0 else state.mode + 1
+        fan_idx = state.fan_mode
 
-        if(state[0] == 0):
-            self._current_hvac_mode = HVAC_MODE_OFF
+        if(0 <= mode_idx < len(_HVAC_OR_OFF)):
+            self._attr_hvac_mode = _HVAC_OR_OFF[mode_idx]
+            self._unknown_mode = None
         else:
-            self._current_hvac_mode = HVAC_MODES_MAP[state[1]]
-        _LOGGER.debug(f"_current_hvac_mode: {self._current_hvac_mode}")
-
-        self._current_fan_mode = FAN_MODES_MAP[state[2]]
-        _LOGGER.debug(f"_current_fan_mode: {self._current_fan_mode}")
-
-        self._target_temperature = state[4]
-        _LOGGER.debug(f"_target_temperature: {self._target_temperature}")
-
-        self._current_temperature = state[5]
-        _LOGGER.debug(f"_current_temperature: {self._current_temperature}")
+            # the unit is on, so don't keep a previous mode that may be off
+            self._attr_hvac_mode = None
+            if(state.mode != self._unknown_mode):
+                _LOGGER.warning("Unknown hvac mode register value %s", state.mode)
+                self._unknown_mode = state.mode
+        _LOGGER.debug("_attr_hvac_mode: %s", self._attr_hvac_mode)
+
+        if(0 <= fan_idx < len(FAN_MODES_MAP)):
+            self._attr_fan_mode = FAN_MODES_MAP[fan_idx]
+            self._unknown_fan_mode = None
+        elif(fan_idx != self._unknown_fan_mode):
+            _LOGGER.warning("Ignoring unknown fan mode register value %s", fan_idx)
+            self._unknown_fan_mode = fan_idx
+        _LOGGER.debug("_attr_fan_mode: %s", self._attr_fan_mode)
+
+        self._attr_target_temperature = state.target_temperature
+        _LOGGER.debug("_attr_target_temperature: %s", self._attr_target_temperature)
+
+        self._attr_current_temperature = state.current_temperature
+        _LOGGER.debug("_attr_current_temperature: %s", self._attr_current_temperature)
         
         _LOGGER.debug("Finished updating state")
 
-    @property
-    def should_poll(self):
-        """Return the polling state."""
-        return True
-
-    @property
-    def name(self):
-        """Return the name of the climate device."""
-        return self._name
-
-    @property
-    def temperature_unit(self):
-        """Return the unit of measurement."""
-        return TEMP_CELSIUS
-
-    @property
-    def current_temperature(self):
-        """Return the current temperature."""
-        return self._current_temperature
-
-    @property
-    def target_temperature(self):
-        """Return the temperature we try to reach."""
-        return self._target_temperature
-
-    @property
-    def hvac_mode(self):
-        """Return current operation ie. heat, cool, idle."""
-        return self._current_hvac_mode
-
-    @property
-    def hvac_modes(self) -> list[str]:
-        """Return the list of available hvac operation modes."""
-        return self._hvac_modes
-
-    @property
-    def fan_mode(self):
-        """Return the fan setting."""
-        return self._current_fan_mode
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state to Home Assistant only when a value has changed."""
+        state = (
+            self.available,
+            self._attr_hvac_mode,
+            self._attr_fan_mode,
+            self._attr_target_temperature,
+            self._attr_current_temperature,
+        )
+        if state == self._written_state:
+            _LOGGER.debug("State unchanged, skipping write")
+            return
 
-    @property
-    def fan_modes(self):
-        """Return the list of available fan modes."""
-        return self._fan_modes
+        self._written_state = state
+        self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -199,49 +231,94 @@ class IntesisModbusRTU(ClimateEntity):
             _LOGGER.error("Received invalid temperature")
             return
 
-        if await self._async_write_int16_to_register(4, target_temperature):
-            self._target_temperature = target_temperature
+        # the unit only accepts whole degrees
+        register_value = round(target_temperature)
+        if await self._async_write_int16_to_register(4, register_value):
+            self._attr_target_temperature = register_value
             self._async_trigger_refresh_after_change()
         else:
             _LOGGER.error("Modbus error setting target temperature to Intesis")
 
     async def async_set_hvac_mode(self, hvac_mode):
-        if(hvac_mode == HVAC_MODE_OFF):
-            await self._async_write_int16_to_register(0, 0)
+        if(hvac_mode == HVACMode.OFF):
+            success = await self._async_write_int16_to_register(0, 0)
         else:
-            register_value = HVAC_MODES_MAP.index(hvac_mode)
-            if(register_value > 0):
-                _LOGGER.debug(f"Setting mode to {hvac_mode} ({register_value})")
-                # set the mode first
-                await self._async_write_int16_to_register(1, register_value)
-                # ensure unit is also powered on
-                await self._async_write_int16_to_register(0, 1)
+            register_value = HVAC_MODES_INDEX.get(hvac_mode, -1)
+            if(register_value >= 0):
+                _LOGGER.debug("Setting mode to %s (%s)", hvac_mode, register_value)
+                # power on (register 0) and set the mode (register 1) in one transaction
+                success = await self._async_write_registers(0, [1, register_value])
             else:
-                _LOGGER.error(f"Invalid hvac_mode {hvac_mode}")
+                _LOGGER.error("Invalid hvac_mode %s", hvac_mode)
                 return False
-        
-        _LOGGER.debug(f"Updated mode to {hvac_mode}, refreshing state")
-        self._current_hvac_mode = hvac_mode
+
+        if not success:
+            _LOGGER.error("Modbus error setting hvac mode %s", hvac_mode)
+            return False
+
+        _LOGGER.debug("Updated mode to %s, refreshing state", hvac_mode)
+        self._attr_hvac_mode = hvac_mode
         self._async_trigger_refresh_after_change()
 
     async def async_set_fan_mode(self, fan_mode):
         """Set new fan mode."""
-        register_value = FAN_MODES_MAP.index(fan_mode)
-        _LOGGER.debug(f"Setting fan mode to {fan_mode} ({register_value})")
+        register_value = FAN_MODES_INDEX.get(fan_mode, -1)
+        if(register_value < 0):
+            _LOGGER.error("Invalid fan_mode %s", fan_mode)
+            return
+        _LOGGER.debug("Setting fan mode to %s (%s)", fan_mode, register_value)
         if await self._async_write_int16_to_register(2, register_value):
-            self._current_fan_mode = fan_mode
+            self._attr_fan_mode = fan_mode
             self._async_trigger_refresh_after_change()
         else:
-            _LOGGER.error(f"Modbus error setting fan mode {fan_mode}")
+            _LOGGER.error("Modbus error setting fan mode %s", fan_mode)
 
-    async def _async_write_int16_to_register(self, register, value) -> bool:
-        value = int(value)
-        result = await self._hub.async_pb_call(
-            self._slave, register, value, CALL_TYPE_WRITE_REGISTER
-        )
-        if result == -1:
+    async def async_turn_on(self):
+        """Turn the unit on in its last used mode."""
+        if await self._async_write_int16_to_register(0, 1):
+            self._async_trigger_refresh_after_change()
+        else:
+            _LOGGER.error("Modbus error turning on Intesis")
+
+    async def async_turn_off(self):
+        """Turn the unit off."""
+        if await self._async_write_int16_to_register(0, 0):
+            self._attr_hvac_mode = HVACMode.OFF
+            self._async_trigger_refresh_after_change()
+        else:
+            _LOGGER.error("Modbus error turning off Intesis")
+
+    async def _async_write_int16_to_register(self, register, value: int) -> bool:
+        async with self.coordinator.lock:
+            result = await self._hub.async_pb_call(
+                self._slave, register, value, CALL_TYPE_WRITE_REGISTER
+            )
+        if result is None or (hasattr(result, "isError") and result.isError()):
+            _LOGGER.debug("Error writing register %s: %s", register, result)
+            return False
+        self.coordinator.async_reset_backoff(self._slave)
+        return True
+
+    async def _async_write_registers(self, start, values: list[int]) -> bool:
+        async with self.coordinator.lock:
+            result = await self._hub.async_pb_call(
+                self._slave, start, values, CALL_TYPE_WRITE_REGISTERS
+            )
+        if result is None or (hasattr(result, "isError") and result.isError()):
+            _LOGGER.debug("Error writing registers from %s: %s", start, result)
             return False
+        self.coordinator.async_reset_backoff(self._slave)
         return True
 
     def _async_trigger_refresh_after_change(self):
-        return self.async_schedule_update_ha_state(force_refresh=True)
+        """Refresh state once the unit has had time to apply the change."""
+        self._async_write_state_if_changed()
+
+        @callback
+        def _async_refresh(_now):
+            self._cancel_refresh = None
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+        if self._cancel_refresh is not None:
+            self._cancel_refresh()
+        self._cancel_refresh = async_call_later(self.hass, 1.0, _async_refresh)
@@ -0,0 +1,3 @@
+"""Constants for the Intesis Hitachi-Modbus climate integration."""
+
+DOMAIN = "intesis_modbusrtu"
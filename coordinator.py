@@ -0,0 +1,132 @@
+"""Coordinator polling every Intesis unit on a Modbus hub."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING
+from homeassistant.components.modbus.modbus import ModbusHub
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(seconds=60)
+
+# Holding registers read from each unit:
+#   0: on/off
+#   1: hvac mode (index into HVAC_MODES_MAP)
+#   2: fan mode (index into FAN_MODES_MAP)
+#   3: vane position (unused)
+#   4: target temperature
+#   5: current temperature
+_READ_COUNT = 6
+
+# after consecutive read failures a unit is next read on scheduled poll
+# 1, 2, 4, ... up to _MAX_BACKOFF_POLLS; the backoff ends half an interval
+# early so timer jitter doesn't push it past the poll it is meant for
+_MAX_BACKOFF_POLLS = 4
+
+
+@dataclass(slots=True)
+class IntesisState:
+    """Raw register values read from a unit."""
+
+    power: int
+    mode: int
+    fan_mode: int
+    target_temperature: int
+    current_temperature: int
+
+    @classmethod
+    def from_registers(cls, registers: list[int]) -> IntesisState:
+        """Build the state from the holding registers read from a unit."""
+        return cls(
+            registers[0], registers[1], registers[2], registers[4], registers[5]
+        )
+
+
+class IntesisCoordinator(DataUpdateCoordinator[dict[int, IntesisState]]):
+    """Read the state of all units on a hub, one slave at a time."""
+
+    def __init__(self, hass: HomeAssistant, hub: ModbusHub, hub_name: str) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {hub_name}",
+            update_interval=SCAN_INTERVAL,
+        )
+        self.hub = hub
+        self.lock = asyncio.Lock()
+        self.slaves: list[int] = []
+        self._offset = 0
+        self._fail_count: dict[int, int] = {}
+        self._next_poll: dict[int, float] = {}
+
+    @callback
+    def async_add_slave(self, slave: int) -> Callable[[], None]:
+        """Poll a slave on each update, returning a callback to stop."""
+        self.slaves.append(slave)
+
+        @callback
+        def remove_slave() -> None:
+            self.slaves.remove(slave)
+            self.async_reset_backoff(slave)
+
+        return remove_slave
+
+    @callback
+    def async_reset_backoff(self, slave: int) -> None:
+        """Read a slave again on the next update, e.g. after it accepted a write."""
+        self._fail_count.pop(slave, None)
+        self._next_poll.pop(slave, None)
+
+    async def _async_update_data(self) -> dict[int, IntesisState]:
+        """Read the holding registers of each registered slave."""
+        # start each cycle at the next slave so a unit that keeps timing out
+        # doesn't always delay the same units behind it
+        offset = self._offset % len(self.slaves) if self.slaves else 0
+        self._offset = offset + 1
+
+        data = {}
+        for slave in self.slaves[offset:] + self.slaves[:offset]:
+            if time.monotonic() < self._next_poll.get(slave, 0):
+                continue
+
+            async with self.lock:
+                result = await self.hub.async_pb_call(
+                    slave, 0, _READ_COUNT, CALL_TYPE_REGISTER_HOLDING
+                )
+            if not result or result == -1 or not hasattr(result, "registers"):
+                fail_count = self._fail_count.get(slave, 0) + 1
+                self._fail_count[slave] = fail_count
+                polls = min(2 ** (fail_count - 1), _MAX_BACKOFF_POLLS)
+                interval = SCAN_INTERVAL.total_seconds()
+                self._next_poll[slave] = (
+                    time.monotonic() + polls * interval - interval / 2
+                )
+                # only report the first failure, the coordinator reports the
+                # hub as failed until a unit answers again
+                _LOGGER.log(
+                    logging.ERROR if fail_count == 1 else logging.DEBUG,
+                    "Modbus error reading state of slave %s, retrying in %s polls",
+                    slave,
+                    polls,
+                )
+                continue
+
+            self.async_reset_backoff(slave)
+            data[slave] = IntesisState.from_registers(result.registers)
+
+        # keep failing while units are only being skipped, so the coordinator
+        # doesn't flip between failed and recovered on every cycle
+        if self.slaves and not data:
+            raise UpdateFailed("No Intesis unit has responded")
+        return data